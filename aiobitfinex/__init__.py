@@ -1 +1 @@
-from .bitfinex_rest import RESTClient
+from .bitfinex_rest import RESTClient, close_default_session
@@ -1,18 +1,87 @@
 import asyncio
 import logging
-import async_timeout
-import base64
-import hashlib
+import binascii
 import time
-import hmac
-import json
+import warnings
 from typing import Optional, List, Tuple
 
 import aiohttp
+import ijson
+import orjson
+from cryptography.hazmat.primitives import hashes, hmac as chmac
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+try:
+    import httpx
+except ImportError:  # Optional, only needed for the HTTP/2 transport
+    httpx = None
+
+try:
+    import simdjson
+except ImportError:  # Optional, only needed for `RESTClient.ticker_fields`
+    simdjson = None
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger('bitfinex.rest')
 
+# Request timeouts. Passed to aiohttp directly so there's a single timer per request
+_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=15, sock_connect=3, sock_read=10)
+_POST_TIMEOUT = aiohttp.ClientTimeout(total=20, sock_connect=3, sock_read=15)
+# Streamed responses are consumed at the caller's pace, so there's no total timeout for them
+_STREAM_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=3, sock_read=10)
+
+# Available transports. `httpx` multiplexes the concurrent requests over a single HTTP/2
+# connection
+TRANSPORTS = ('aiohttp', 'httpx')
+
+# Headers for the endpoints with small responses, where inflating gzip costs more than the bytes
+# it saves on the wire
+_NO_COMPRESSION_HEADERS = {'Accept-Encoding': 'identity'}
+
+# Seconds that the responses of endpoints that rarely change (symbols, etc) are cached
+_CACHE_TTL = 3600
+
+# Session shared by every client created without an explicit one, so the connection pool
+# (and the keep-alive connections to api.bitfinex.com) is reused between clients
+_default_session: Optional[aiohttp.ClientSession] = None
+# Event loop where the default session was created. A session can't be used from another loop
+_default_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_default_session() -> aiohttp.ClientSession:
+    """
+    Returns the module level session, creating it if it doesn't exist, it was closed or it
+    belongs to a different event loop
+    """
+    global _default_session, _default_session_loop
+    loop = asyncio.get_running_loop()
+    if _default_session is None or _default_session.closed or _default_session_loop is not loop:
+        # All the requests go to the same host, so keep more connections per host and keep them
+        # alive longer than the aiohttp defaults (15s) to avoid new TLS handshakes after idling
+        connector = aiohttp.TCPConnector(limit=100,
+                                         limit_per_host=32,
+                                         ttl_dns_cache=300,
+                                         keepalive_timeout=75,
+                                         enable_cleanup_closed=True)
+        _default_session = aiohttp.ClientSession(connector=connector)
+        _default_session_loop = loop
+    return _default_session
+
+
+async def close_default_session():
+    """
+    Closes the module level session shared by the clients. The clients never close it
+    themselves, so it should be called once they are no longer needed. Waits a little after
+    closing it so the SSL transports can finish their shutdown before the event loop is closed
+    """
+    global _default_session, _default_session_loop
+    if _default_session is not None and not _default_session.closed:
+        await _default_session.close()
+        await asyncio.sleep(0.25)
+    _default_session = None
+    _default_session_loop = None
+
 
 class NoAPIKeys(Exception):
     pass
@@ -21,95 +90,155 @@ class NoAPIKeys(Exception):
 class APIPath:
     """Path definitions for the Bitfinex REST API"""
 
-    API_ROOT = 'https://api.bitfinex.com/v1/{}'
+    API_HOST = 'https://api.bitfinex.com'
+    API_ROOT = API_HOST + '/v1/'
 
     # -- Public endpoints. http://docs.bitfinex.com/v1/reference
 
-    SYMBOLS = API_ROOT.format('symbols')
-    SYMBOLS_DETAILS = API_ROOT.format('symbols_details')
+    SYMBOLS = API_ROOT + 'symbols'
+    SYMBOLS_DETAILS = API_ROOT + 'symbols_details'
 
-    # - Uses symbol (btcusd, etc)
-    TICKER = API_ROOT.format('pubticker/{}')
-    STATS = API_ROOT.format('stats/{}')
-    TRADES = API_ROOT.format('trades/{}')
+    # - Uses symbol (btcusd, etc). Prefixes, the symbol is appended to them
+    TICKER = API_ROOT + 'pubticker/'
+    STATS = API_ROOT + 'stats/'
+    TRADES = API_ROOT + 'trades/'
 
-    # - Uses currency ('USD, etc)
-    FUNDING_BOOK = API_ROOT.format('lendbook/{}')
-    ORDER_BOOK = API_ROOT.format('orderbook/{}')
-    LENDS = API_ROOT.format('lends/{}')
+    # - Uses currency ('USD, etc). Prefixes, the currency is appended to them
+    FUNDING_BOOK = API_ROOT + 'lendbook/'
+    ORDER_BOOK = API_ROOT + 'orderbook/'
+    LENDS = API_ROOT + 'lends/'
 
     # -- Authenticated endpoints. http://docs.bitfinex.com/v1/reference#rest-auth-account-info
-    ACCOUNT_INFO = API_ROOT.format('account_infos')
-    SUMMARY = API_ROOT.format('summary')
-    DEPOSIT = API_ROOT.format('deposit/new')
-    KEY_PERMISSIONS = API_ROOT.format('key_info')
-    MARGIN_INFO = API_ROOT.format('margin_infos')
-    BALANCES = API_ROOT.format('balances')
-    TRANSFER = API_ROOT.format('transfer')
-    WITHDRAWAL = API_ROOT.format('withdraw')
+    ACCOUNT_INFO = API_ROOT + 'account_infos'
+    SUMMARY = API_ROOT + 'summary'
+    DEPOSIT = API_ROOT + 'deposit/new'
+    KEY_PERMISSIONS = API_ROOT + 'key_info'
+    MARGIN_INFO = API_ROOT + 'margin_infos'
+    BALANCES = API_ROOT + 'balances'
+    TRANSFER = API_ROOT + 'transfer'
+    WITHDRAWAL = API_ROOT + 'withdraw'
 
     # - Orders. http://docs.bitfinex.com/v1/reference#rest-auth-orders
-    ACTIVE_ORDERS = API_ROOT.format('orders')
-    ORDER_ROOT = API_ROOT.format('order/{}')
-    NEW_ORDER = ORDER_ROOT.format('new')
-    NEW_ORDER_MULTI = ORDER_ROOT.format('new/multi')
-    CANCEL_ORDER = ORDER_ROOT.format('cancel')
-    CANCEL_ORDER_MULTI = ORDER_ROOT.format('cancel/multi')
-    CANCEL_ORDER_ALL = ORDER_ROOT.format('cancel/all')
-    REPLACE_ORDER = ORDER_ROOT.format('replace')
-    STATUS_ORDER = ORDER_ROOT.format('status')
+    ACTIVE_ORDERS = API_ROOT + 'orders'
+    ORDER_ROOT = API_ROOT + 'order/'
+    NEW_ORDER = ORDER_ROOT + 'new'
+    NEW_ORDER_MULTI = ORDER_ROOT + 'new/multi'
+    CANCEL_ORDER = ORDER_ROOT + 'cancel'
+    CANCEL_ORDER_MULTI = ORDER_ROOT + 'cancel/multi'
+    CANCEL_ORDER_ALL = ORDER_ROOT + 'cancel/all'
+    REPLACE_ORDER = ORDER_ROOT + 'replace'
+    STATUS_ORDER = ORDER_ROOT + 'status'
 
     # - Positions. http://docs.bitfinex.com/v1/reference#rest-auth-positions
-    ACTIVE_POSITIONS = API_ROOT.format('positions')
-    CLAIM_POSITION = API_ROOT.format('position/claim')
+    ACTIVE_POSITIONS = API_ROOT + 'positions'
+    CLAIM_POSITION = API_ROOT + 'position/claim'
 
     # - Historical data. http://docs.bitfinex.com/v1/reference#rest-auth-historical-data
-    HISTORY = API_ROOT.format('history')
-    MOVEMENTS = API_ROOT.format('history/movements')
-    PAST_TRADES = API_ROOT.format('mytrades')
+    HISTORY = API_ROOT + 'history'
+    MOVEMENTS = API_ROOT + 'history/movements'
+    PAST_TRADES = API_ROOT + 'mytrades'
 
     # - Marging Funding. http://docs.bitfinex.com/v1/reference#rest-auth-margin-funding
-    OFFERS = API_ROOT.format('offers')
-    OFFER_ROOT = API_ROOT.format('offer/{}')
-    NEW_OFFER = OFFER_ROOT.format('new')
-    CANCEL_OFFER = OFFER_ROOT.format('cancel')
-    STATUS_OFFER = OFFER_ROOT.format('status')
+    OFFERS = API_ROOT + 'offers'
+    OFFER_ROOT = API_ROOT + 'offer/'
+    NEW_OFFER = OFFER_ROOT + 'new'
+    CANCEL_OFFER = OFFER_ROOT + 'cancel'
+    STATUS_OFFER = OFFER_ROOT + 'status'
 
-    ACTIVE_CREDITS = API_ROOT.format('credits')
-    TAKEN_FUNDS = API_ROOT.format('taken_funds')
-    UNUSED_TAKEN_FUNDS = API_ROOT.format('unused_taken_funds')
-    TOTAL_TAKEN_FUNDS = API_ROOT.format('total_taken_funds')
-    CLOSE_FUNDING = API_ROOT.format('funding/close')
+    ACTIVE_CREDITS = API_ROOT + 'credits'
+    TAKEN_FUNDS = API_ROOT + 'taken_funds'
+    UNUSED_TAKEN_FUNDS = API_ROOT + 'unused_taken_funds'
+    TOTAL_TAKEN_FUNDS = API_ROOT + 'total_taken_funds'
+    CLOSE_FUNDING = API_ROOT + 'funding/close'
 
 
 class RESTClient:
     """
     Async client for the bitfinex HTTP REST API.
+
+    The sessions are created lazily on the running loop of the first request, so the client can
+    be built outside a running loop. The `loop` argument is deprecated and ignored
     """
 
     def __init__(self,
                  api_key: Optional[str] = None,
                  api_secret: Optional[str] = None,
                  loop: Optional[asyncio.BaseEventLoop] = None,
-                 session: aiohttp.ClientSession = None):
-
-        self._loop = loop or asyncio.get_event_loop()
-        self._session = session or aiohttp.ClientSession(loop=self._loop)
+                 session: aiohttp.ClientSession = None,
+                 transport: str = 'aiohttp'):
+
+        if transport not in TRANSPORTS:
+            raise ValueError(f'Unknown transport {transport}. Use one of {TRANSPORTS}')
+        if transport == 'httpx' and httpx is None:
+            raise ImportError('The httpx transport requires httpx. Install aiobitfinex[http2]')
+        if transport == 'httpx' and session is not None:
+            raise ValueError('An aiohttp session can only be used with the aiohttp transport')
+
+        if loop is not None:
+            warnings.warn('The loop argument is deprecated and ignored. The running loop is used',
+                          DeprecationWarning, stacklevel=2)
+
+        self._transport = transport
+        # Session given by the caller, who owns it. When it's not given the shared default
+        # session is used (see `_get_session`). The httpx client is created lazily on the first
+        # request and owned by this client (see `_get_httpx_client`)
+        self._session = session
+        self._httpx_client = None
+        # Parser for the responses where only some fields are needed. Created on first use and
+        # reused because simdjson keeps its internal buffers between documents
+        self._json_parser = None
+        # Raw bodies of the cached endpoints. Maps the url to a (timestamp, body) tuple. The
+        # bodies are parsed on every hit so each caller gets its own objects
+        self._cache = {}
 
         # Setting a property `keys` if the keys were provided. They are needed for the private
         # enpoints
         if api_key and api_secret:
             self._api_key = api_key
             self._api_secret = bytes(api_secret, 'utf-8')
+            # Keyed HMAC copied on every request, so the key is only processed once
+            self._hmac = chmac.HMAC(self._api_secret, hashes.SHA384())
+            # Static part of the auth headers, copied and completed on every request
+            self._headers_template = {'X-BFX-APIKEY': self._api_key}
             self.keys = True
+            # Nonce of the authenticated requests. It must always increase, so it's started with
+            # the current time in microseconds and incremented on every request
+            self._nonce = int(time.time() * 1e6)
         else:
             self.keys = False
             logger.warning('The API keys was not provided. The authenticated API methdos wont'
                            ' be available')
 
-    def __del__(self):
-        if not self._session.closed:
-            self._session.close()
+    async def __aenter__(self) -> 'RESTClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the connections created by this client. The aiohttp session isn't closed: the
+        one passed to the constructor belongs to the caller and the shared default one is
+        closed with `close_default_session`
+        """
+        if self._httpx_client is not None:
+            await self._httpx_client.aclose()
+            self._httpx_client = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Returns the session used for the requests, falling back to the shared default one"""
+        if self._session is not None:
+            return self._session
+        return await get_default_session()
+
+    def _get_httpx_client(self) -> 'httpx.AsyncClient':
+        """Returns the HTTP/2 client used by the httpx transport, creating it if needed"""
+        if self._httpx_client is None:
+            self._httpx_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20),
+                timeout=httpx.Timeout(15, connect=3))
+        return self._httpx_client
 
     def _prepare_post(self, url: str, payload: dict) -> Tuple[any, dict]:
         """
@@ -121,22 +250,21 @@ class RESTClient:
         :return: the headers auth headers that should be send with the request
         """
         # Adding the url endpoint to the request. Striping https://api.bitfinex.com
-        payload['request'] = '/{}'.format('/'.join(url.split('/')[3:]))
+        payload['request'] = url[len(APIPath.API_HOST):]
 
         # Adding nonce to the payload
-        payload['nonce'] = str(time.time())
+        self._nonce += 1
+        payload['nonce'] = str(self._nonce)
 
-        payload_json = json.dumps(payload)
-        payload_b64 = base64.b64encode(bytes(payload_json, 'utf-8'))
+        payload_b64 = binascii.b2a_base64(orjson.dumps(payload), newline=False)
 
-        signature = hmac.new(key=self._api_secret, msg=payload_b64, digestmod=hashlib.sha384)
-        signature = signature.hexdigest()
+        signature = self._hmac.copy()
+        signature.update(payload_b64)
+        signature = signature.finalize().hex()
 
-        headers = {
-            'X-BFX-APIKEY': self._api_key,
-            'X-BFX-PAYLOAD': str(payload_b64, 'utf-8'),
-            'X-BFX-SIGNATURE': signature,
-        }
+        headers = self._headers_template.copy()
+        headers['X-BFX-PAYLOAD'] = payload_b64.decode('ascii')
+        headers['X-BFX-SIGNATURE'] = signature
         return payload_b64, headers
 
     async def _post(self, url, payload=None) -> any:
@@ -158,32 +286,166 @@ class RESTClient:
         payload_encoded, headers = self._prepare_post(url, payload)
 
         logger.debug(f'Sending post request to {url}')
-        with async_timeout.timeout(20):
-            async with self._session.post(url, data=payload_encoded, headers=headers) as resp:
-                if 200 <= resp.status < 300:
-                    return await resp.json()
-                else:
-                    print(resp.text())
-                    raise aiohttp.errors.HttpProcessingError(
-                        message=f'There was a problem processing {url}', code=resp.status)
+        if self._transport == 'httpx':
+            resp = await self._get_httpx_client().post(url, content=payload_encoded,
+                                                       headers=headers,
+                                                       timeout=httpx.Timeout(20, connect=3))
+            return orjson.loads(self._check_httpx_response(url, resp))
+
+        session = await self._get_session()
+        async with session.post(url, data=payload_encoded, headers=headers,
+                                timeout=_POST_TIMEOUT) as resp:
+            if 200 <= resp.status < 300:
+                return orjson.loads(await resp.read())
+            else:
+                await self._raise_response_error(url, resp)
 
-    async def _fetch(self, url: str) -> any:
+    async def _fetch(self, url: str, headers: Optional[dict] = None) -> any:
         """
-        Performs a GET request, checking the response code to see if it's between 200 - 300.
-        If it's, it parses the JSON to a python object. If not it raises an HTTP error
+        Performs a GET request (see `_fetch_bytes`) and parses the JSON response to a python
+        object
 
         :url: the api url
+        :headers: extra headers to be send with the request
         :return: The Bitfinex API response
         """
+        return orjson.loads(await self._fetch_bytes(url, headers))
+
+    async def _fetch_bytes(self, url: str, headers: Optional[dict] = None) -> bytes:
+        """
+        Performs a GET request, checking the response code to see if it's between 200 - 300.
+        If it's, it returns the raw response body. If not it raises an HTTP error
+
+        :url: the api url
+        :headers: extra headers to be send with the request
+        :return: The Bitfinex API response body
+        """
         logger.debug(f'Fetching {url}')
-        with async_timeout.timeout(15):
-            async with self._session.get(url) as resp:
-                if 200 <= resp.status < 300:
-                    return await resp.json()
+        if self._transport == 'httpx':
+            resp = await self._get_httpx_client().get(url, headers=headers)
+            return self._check_httpx_response(url, resp)
+
+        session = await self._get_session()
+        async with session.get(url, headers=headers, timeout=_FETCH_TIMEOUT) as resp:
+            if 200 <= resp.status < 300:
+                return await resp.read()
+            else:
+                await self._raise_response_error(url, resp)
+
+    @staticmethod
+    async def _raise_response_error(url: str, resp: aiohttp.ClientResponse):
+        """
+        Logs the body of a failed aiohttp response and raises an HTTP error with its status.
+        The body is decoded leniently, so a non UTF-8 error page doesn't hide the HTTP error
+
+        :url: the api url
+        :resp: the aiohttp response
+        """
+        body = (await resp.read()).decode('utf-8', 'replace')
+        logger.error('Bitfinex %s returned %s: %s', url, resp.status, body)
+        raise aiohttp.ClientResponseError(resp.request_info, resp.history, status=resp.status,
+                                          message=f'There was a problem processing {url}')
+
+    @staticmethod
+    def _check_httpx_response(url: str, resp: 'httpx.Response') -> bytes:
+        """
+        Checks if the response code of an httpx response is between 200 - 300. If it's, it
+        returns the raw response body. If not it raises an HTTP error
+
+        :url: the api url
+        :resp: the httpx response
+        :return: The Bitfinex API response body
+        """
+        if 200 <= resp.status_code < 300:
+            return resp.content
+        else:
+            RESTClient._raise_httpx_error(url, resp)
+
+    @staticmethod
+    def _raise_httpx_error(url: str, resp: 'httpx.Response'):
+        """
+        Logs the body of a failed httpx response and raises the same HTTP error as the aiohttp
+        transport (see `_raise_response_error`). The body must have been already read
+
+        :url: the api url
+        :resp: the httpx response
+        """
+        body = resp.content.decode('utf-8', 'replace')
+        logger.error('Bitfinex %s returned %s: %s', url, resp.status_code, body)
+        request_info = aiohttp.RequestInfo(
+            URL(url), resp.request.method,
+            CIMultiDictProxy(CIMultiDict(resp.request.headers.items())))
+        raise aiohttp.ClientResponseError(request_info, (), status=resp.status_code,
+                                          message=f'There was a problem processing {url}')
+
+    async def _fetch_cached(self, url: str, headers: Optional[dict] = None) -> any:
+        """
+        Same as `_fetch` but reusing the previous response body of the url if it's newer than
+        _CACHE_TTL seconds
+
+        :url: the api url
+        :headers: extra headers to be send with the request
+        :return: The Bitfinex API response
+        """
+        cached = self._cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+            return orjson.loads(cached[1])
+
+        body = await self._fetch_bytes(url, headers)
+        self._cache[url] = (time.monotonic(), body)
+        return orjson.loads(body)
+
+    async def _fetch_stream(self, url: str, prefix: str):
+        """
+        Performs a GET request parsing the JSON response while it's being downloaded, instead of
+        buffering the whole body. Yields the python objects found under the given prefix one by
+        one. If the response code isn't between 200 - 300 it raises an HTTP error
+
+        :url: the api url
+        :prefix: ijson prefix of the items to yield (`bids.item`, `item`, etc)
+        :return: an async generator with the items of the Bitfinex API response
+        """
+        logger.debug(f'Streaming {url}')
+        if self._transport == 'httpx':
+            client = self._get_httpx_client()
+            async with client.stream('GET', url) as resp:
+                if 200 <= resp.status_code < 300:
+                    async for item in self._parse_stream(resp.aiter_bytes(), prefix):
+                        yield item
                 else:
-                    print(resp.text())
-                    raise aiohttp.errors.HttpProcessingError(
-                        message=f'There was a problem processing {url}', code=response.status)
+                    await resp.aread()
+                    self._raise_httpx_error(url, resp)
+            return
+
+        session = await self._get_session()
+        async with session.get(url, timeout=_STREAM_TIMEOUT) as resp:
+            if 200 <= resp.status < 300:
+                async for item in self._parse_stream(resp.content.iter_chunked(65536), prefix):
+                    yield item
+            else:
+                await self._raise_response_error(url, resp)
+
+    @staticmethod
+    async def _parse_stream(chunks, prefix: str):
+        """
+        Feeds the chunks of a JSON document to ijson, yielding the objects found under the
+        given prefix as soon as they are complete
+
+        :chunks: async iterator with the raw chunks of the document
+        :prefix: ijson prefix of the items to yield
+        :return: an async generator with the parsed items
+        """
+        items = ijson.sendable_list()
+        # Floats, like the buffered responses parsed with orjson, instead of ijson's decimals
+        parser = ijson.items_coro(items, prefix, use_float=True)
+        async for chunk in chunks:
+            parser.send(chunk)
+            for item in items:
+                yield item
+            del items[:]
+        parser.close()
+        for item in items:
+            yield item
 
     async def ticker(self, symbol: str) -> dict:
         """
@@ -194,7 +456,31 @@ class RESTClient:
         at the available symbols with the symbol method.
         :return:
         """
-        return await self._fetch(APIPath.TICKER.format(symbol))
+        return await self._fetch(APIPath.TICKER + symbol, _NO_COMPRESSION_HEADERS)
+
+    async def ticker_fields(self, symbol: str, fields: Tuple[str, ...] = ('last_price',)) -> dict:
+        """
+        Same as `ticker` but only returning the given fields. Only the requested fields are
+        converted to python objects, the rest of the response is skipped
+
+        :param symbol: the currency pair that you want information. (btcusd, etc). Yo can look
+        at the available symbols with the symbol method.
+        :param fields: the ticker fields to be returned (last_price, bid, ask, volume, etc)
+        :return: a dict with the requested fields
+        """
+        if simdjson is None:
+            raise ImportError('ticker_fields requires pysimdjson. Install aiobitfinex[simdjson]')
+
+        body = await self._fetch_bytes(APIPath.TICKER + symbol, _NO_COMPRESSION_HEADERS)
+        if self._json_parser is None:
+            self._json_parser = simdjson.Parser()
+        document = self._json_parser.parse(body)
+        try:
+            return {field: document[field] for field in fields}
+        finally:
+            # The parser can't parse again while a document from it is alive, and a KeyError
+            # traceback would keep it referenced
+            del document
 
     async def stats(self, symbol: str) -> dict:
         """
@@ -205,7 +491,7 @@ class RESTClient:
         at the available symbols with the symbol method.
         :return: stats about the requested pair
         """
-        return await self._fetch((APIPath.STATS.format(symbol)))
+        return await self._fetch(APIPath.STATS + symbol, _NO_COMPRESSION_HEADERS)
 
     async def trades(self, symbol: str) -> List[dict]:
         """
@@ -216,7 +502,7 @@ class RESTClient:
         at the available symbols with the symbol method.
         :return: a list with the most recent trades
         """
-        return await self._fetch(APIPath.TRADES.format(symbol))
+        return await self._fetch(APIPath.TRADES + symbol)
 
     async def funding_book(self, currency: str) -> dict:
         """
@@ -226,7 +512,7 @@ class RESTClient:
         :param currency: the currency in what you want the information
         :return:
         """
-        return await self._fetch((APIPath.FUNDING_BOOK.format(currency)))
+        return await self._fetch(APIPath.FUNDING_BOOK + currency)
 
     async def order_book(self, currency: str) -> dict:
         """
@@ -236,7 +522,41 @@ class RESTClient:
         :param currency: the currency in what you want the information
         :return:
         """
-        return await self._fetch(APIPath.ORDER_BOOK.format(currency))
+        return await self._fetch(APIPath.ORDER_BOOK + currency)
+
+    async def iter_bids(self, currency: str):
+        """
+        Iterates over the bids of the order book without loading the full response in memory
+        API URL: http://docs.bitfinex.com/v1/reference#rest-public-orderbook
+
+        :param currency: the currency in what you want the information
+        :return: an async generator yielding a dict per bid
+        """
+        async for bid in self._fetch_stream(APIPath.ORDER_BOOK + currency, 'bids.item'):
+            yield bid
+
+    async def iter_asks(self, currency: str):
+        """
+        Iterates over the asks of the order book without loading the full response in memory
+        API URL: http://docs.bitfinex.com/v1/reference#rest-public-orderbook
+
+        :param currency: the currency in what you want the information
+        :return: an async generator yielding a dict per ask
+        """
+        async for ask in self._fetch_stream(APIPath.ORDER_BOOK + currency, 'asks.item'):
+            yield ask
+
+    async def iter_trades(self, symbol: str):
+        """
+        Iterates over the most recent trades without loading the full response in memory
+        API URL: http://docs.bitfinex.com/v1/reference#rest-public-trades
+
+        :param symbol: the currency pair that you want information. (btcusd, etc). Yo can look
+        at the available symbols with the symbol method.
+        :return: an async generator yielding a dict per trade
+        """
+        async for trade in self._fetch_stream(APIPath.TRADES + symbol, 'item'):
+            yield trade
 
     async def lends(self, currency: str) -> List[dict]:
         """
@@ -245,15 +565,67 @@ class RESTClient:
         :param currency:
         :return:
         """
-        return await self._fetch(APIPath.LENDS.format(currency))
+        return await self._fetch(APIPath.LENDS + currency)
 
     async def symbols(self) -> List[dict]:
-        """Gets a list with the available symbol names in the exchange"""
-        return await self._fetch(APIPath.SYMBOLS)
+        """Gets a list with the available symbol names in the exchange. Cached for an hour"""
+        return await self._fetch_cached(APIPath.SYMBOLS, _NO_COMPRESSION_HEADERS)
 
     async def symbols_details(self) -> List[dict]:
-        """Gets a detailed list with the available symbols on the exchange"""
-        return await self._fetch(APIPath.SYMBOLS)
+        """Gets a detailed list with the available symbols on the exchange. Cached for an hour"""
+        return await self._fetch_cached(APIPath.SYMBOLS_DETAILS)
+
+    # Batched methods
+    async def _gather(self, method, args: List[str], concurrency: int) -> list:
+        """
+        Calls the given client method once per argument concurrently. Limiting the number of
+        requests in flight to `concurrency`
+
+        :param method: the client coroutine method to be called
+        :param args: list of arguments. The method is called once with each of them
+        :param concurrency: max number of requests to be done at the same time. At least 1
+        :return: a list with the results in the same order as the arguments
+        """
+        if concurrency < 1:
+            raise ValueError(f'concurrency must be at least 1, got {concurrency}')
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(arg):
+            async with semaphore:
+                return await method(arg)
+
+        return await asyncio.gather(*(bounded(arg) for arg in args))
+
+    async def tickers(self, symbols: List[str], concurrency: int = 16) -> List[dict]:
+        """
+        Gets the ticker of every given symbol. See `ticker`
+
+        :param symbols: list of currency pairs (btcusd, etc)
+        :param concurrency: max number of requests to be done at the same time. At least 1
+        :return: a list with the tickers in the same order as the symbols
+        """
+        return await self._gather(self.ticker, symbols, concurrency)
+
+    async def order_books(self, currencies: List[str], concurrency: int = 16) -> List[dict]:
+        """
+        Gets the order book of every given currency. See `order_book`
+
+        :param currencies: list of currencies
+        :param concurrency: max number of requests to be done at the same time. At least 1
+        :return: a list with the order books in the same order as the currencies
+        """
+        return await self._gather(self.order_book, currencies, concurrency)
+
+    async def trades_batch(self, symbols: List[str], concurrency: int = 16) -> List[List[dict]]:
+        """
+        Gets the most recent trades of every given symbol. See `trades`
+
+        :param symbols: list of currency pairs (btcusd, etc)
+        :param concurrency: max number of requests to be done at the same time. At least 1
+        :return: a list with the trades lists in the same order as the symbols
+        """
+        return await self._gather(self.trades, symbols, concurrency)
 
     # Authenticated methods
     async def account_info(self) -> List[dict]:
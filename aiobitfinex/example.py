@@ -1,13 +1,12 @@
 import asyncio
 
-from aiobitfinex import RESTClient
+from aiobitfinex import RESTClient, close_default_session
 
-async def main(loop):
-    bitfinex = RESTClient(loop)
-    ticker = await bitfinex.ticker('btcusd')
-    print(ticker)
+async def main():
+    async with RESTClient() as bitfinex:
+        ticker = await bitfinex.ticker('btcusd')
+        print(ticker)
+    await close_default_session()
 
 
-loop = asyncio.get_event_loop()
-loop.run_until_complete(main(loop))
-
+asyncio.run(main())
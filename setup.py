@@ -4,4 +4,14 @@ setup(
     name="aiobitfinex",
     version="0.0.1",
     packages=find_packages(),
+    install_requires=[
+        'aiohttp>=3.3',
+        'cryptography',
+        'ijson>=3.1',
+        'orjson',
+    ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'simdjson': ['pysimdjson'],
+    },
 )
@@ -0,0 +1,188 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import warnings
+
+import aiohttp
+import orjson
+import pytest
+
+from aiobitfinex import bitfinex_rest
+from aiobitfinex.bitfinex_rest import APIPath, RESTClient
+
+
+def test_prepare_post_signature():
+    secret = 'secret'
+    client = RESTClient('key', secret)
+    client._nonce = 1000
+    payload_b64, headers = client._prepare_post(APIPath.BALANCES, {'currency': 'usd'})
+    # Signing twice checks that the cached HMAC isn't consumed by the first signature
+    _, headers_again = client._prepare_post(APIPath.BALANCES, {'currency': 'usd'})
+
+    assert orjson.loads(base64.b64decode(payload_b64)) == {
+        'currency': 'usd', 'request': '/v1/balances', 'nonce': '1001'}
+    assert headers['X-BFX-APIKEY'] == 'key'
+    assert headers['X-BFX-PAYLOAD'] == payload_b64.decode('ascii')
+    expected = hmac.new(secret.encode(), payload_b64, hashlib.sha384).hexdigest()
+    assert headers['X-BFX-SIGNATURE'] == expected
+
+    payload_again = headers_again['X-BFX-PAYLOAD'].encode('ascii')
+    expected_again = hmac.new(secret.encode(), payload_again, hashlib.sha384).hexdigest()
+    assert headers_again['X-BFX-SIGNATURE'] == expected_again
+
+
+def test_gather_rejects_concurrency_below_one():
+    async def run(concurrency):
+        client = RESTClient()
+
+        async def method(arg):
+            return arg
+
+        return await client._gather(method, [1, 2], concurrency)
+
+    assert asyncio.run(run(1)) == [1, 2]
+    for concurrency in (0, -1):
+        with pytest.raises(ValueError):
+            asyncio.run(run(concurrency))
+
+
+def test_client_is_built_without_an_event_loop():
+    asyncio.set_event_loop(None)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        RESTClient()
+
+    with pytest.warns(DeprecationWarning):
+        RESTClient(loop=object())
+
+
+def test_parse_stream_numbers_match_orjson():
+    body = b'{"bids": [{"price": "1", "amount": 1.25, "count": 2}], "asks": []}'
+
+    async def chunks():
+        for i in range(0, len(body), 7):
+            yield body[i:i + 7]
+
+    async def run():
+        return [bid async for bid in RESTClient._parse_stream(chunks(), 'bids.item')]
+
+    bids = asyncio.run(run())
+    assert bids == orjson.loads(body)['bids']
+    assert type(bids[0]['amount']) is float
+
+
+def test_symbols_cache(monkeypatch):
+    client = RESTClient()
+    requested = []
+
+    async def fetch_bytes(url, headers=None):
+        requested.append(url)
+        return b'["btcusd", "ethusd"]'
+
+    monkeypatch.setattr(client, '_fetch_bytes', fetch_bytes)
+    now = [1000.0]
+    monkeypatch.setattr(bitfinex_rest.time, 'monotonic', lambda: now[0])
+
+    async def run():
+        first = await client.symbols()
+        first.remove('btcusd')
+        second = await client.symbols()
+        assert requested == [APIPath.SYMBOLS]
+        assert second == ['btcusd', 'ethusd']
+
+        now[0] += bitfinex_rest._CACHE_TTL
+        await client.symbols()
+        assert requested == [APIPath.SYMBOLS, APIPath.SYMBOLS]
+
+        await client.symbols_details()
+        assert requested[-1] == APIPath.SYMBOLS_DETAILS
+
+    asyncio.run(run())
+
+
+def test_ticker_fields_after_missing_field(monkeypatch):
+    pytest.importorskip('simdjson')
+    client = RESTClient()
+
+    async def fetch_bytes(url, headers=None):
+        return b'{"last_price": "100.5", "bid": "100.4", "ask": "100.6"}'
+
+    monkeypatch.setattr(client, '_fetch_bytes', fetch_bytes)
+
+    async def run():
+        # Keeping the exception info alive keeps its traceback frames alive, like a caller that
+        # stores or logs the error would
+        with pytest.raises(KeyError) as error:
+            await client.ticker_fields('btcusd', ('missing',))
+        fields = await client.ticker_fields('btcusd', ('bid', 'ask'))
+        assert isinstance(error.value, KeyError)
+        return fields
+
+    assert asyncio.run(run()) == {'bid': '100.4', 'ask': '100.6'}
+
+
+def _httpx_client(status, body):
+    """RESTClient using the httpx transport, answering every request with the given response"""
+    httpx = pytest.importorskip('httpx')
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(status, content=body)
+
+    client = RESTClient('key', 'secret', transport='httpx')
+    client._httpx_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, requests
+
+
+def test_httpx_transport():
+    client, requests = _httpx_client(200, b'{"bids": [{"price": "1"}], "asks": []}')
+
+    async def run():
+        try:
+            assert await client._fetch(APIPath.ORDER_BOOK + 'btcusd') == {
+                'bids': [{'price': '1'}], 'asks': []}
+            assert await client._post(APIPath.BALANCES) == {'bids': [{'price': '1'}], 'asks': []}
+            bids = [bid async for bid in client._fetch_stream(APIPath.ORDER_BOOK + 'btcusd',
+                                                               'bids.item')]
+            assert bids == [{'price': '1'}]
+        finally:
+            await client.close()
+
+    asyncio.run(run())
+    assert [request.method for request in requests] == ['GET', 'POST', 'GET']
+    assert requests[1].headers['X-BFX-APIKEY'] == 'key'
+
+
+@pytest.mark.parametrize('method', ['get', 'post', 'stream'])
+def test_httpx_transport_errors(method):
+    client, _ = _httpx_client(502, b'\xff bad gateway')
+
+    async def run():
+        url = APIPath.ORDER_BOOK + 'btcusd'
+        try:
+            if method == 'get':
+                await client._fetch_bytes(url)
+            elif method == 'post':
+                await client._post(url)
+            else:
+                await client._fetch_stream(url, 'bids.item').__anext__()
+        finally:
+            await client.close()
+
+    with pytest.raises(aiohttp.ClientResponseError) as error:
+        asyncio.run(run())
+    assert error.value.status == 502
+    assert str(error.value.request_info.url) == APIPath.ORDER_BOOK + 'btcusd'
+
+
+def test_httpx_transport_rejects_aiohttp_session():
+    pytest.importorskip('httpx')
+
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(ValueError):
+                RESTClient(session=session, transport='httpx')
+
+    asyncio.run(run())